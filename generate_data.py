@@ -3,21 +3,45 @@ import random
 from random import choice
 from random import randint
 from random import uniform
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from collections import defaultdict
-from typing import List, Any, Tuple
+from typing import List, Tuple
 import sqlite3
+import os
+from row_batch import RowBatch
 
+# Generation settings. SFP_SEED makes the data reproducible, SFP_SCALE multiplies the number of rows.
+seed = os.environ.get("SFP_SEED")
+scale = int(os.environ.get("SFP_SCALE", "1"))
+locale = os.environ.get("SFP_LOCALE", "en_GB")
 
-fake = Faker('en_GB')
+if scale < 1:
+    raise ValueError("SFP_SCALE must be a positive integer.")
+
+fake = Faker(locale)
+
+# Dates are generated relative to this day. Seeded runs use a fixed day so the same seed always gives the same data.
+today = date.today()
+
+if seed is not None:
+    Faker.seed(int(seed))
+    random.seed(int(seed))
+    today = date(2025, 1, 1)
+
+employees_count = 50 * scale
+projects_count = 10 * scale
 
 # Employees table. PRIMARY_KEY = employee_id.
-employees_id = list(range(1, 51))
-first_names = [fake.first_name() for _ in range(50)]
-last_names = [fake.last_name() for _ in range(50)]
-emails = [fake.unique.email() for _ in range(50)]
-phone_numbers = ['+44 ' + fake.msisdn()[3:] for _ in range(50)]
-hire_dates = [fake.date_between(start_date='-5y', end_date='today').strftime('%d.%m.%Y') for _ in range(50)]
+employees_id = list(range(1, employees_count + 1))
+first_names = [fake.first_name() for _ in range(employees_count)]
+last_names = [fake.last_name() for _ in range(employees_count)]
+emails = [fake.unique.email() for _ in range(employees_count)]
+# UK numbers keep the original '+44 ' format, other locales use Faker's local phone format.
+if locale == 'en_GB':
+    phone_numbers = ['+44 ' + fake.msisdn()[3:] for _ in range(employees_count)]
+else:
+    phone_numbers = [fake.phone_number() for _ in range(employees_count)]
+hire_dates = [fake.date_between(start_date=today - timedelta(days=5 * 365), end_date=today).strftime('%d.%m.%Y') for _ in range(employees_count)]
 
 job_salary_ranges = {
     'Software Engineer': (2000, 3200),
@@ -27,7 +51,7 @@ job_salary_ranges = {
     'QA': (1800, 2900)
 }
 
-def generate_employees(employees_id: List[int], job_salary_ranges: dict[str, tuple]) -> dict[int, dict[str, Any]]:
+def generate_employees(employees_id: List[int], job_salary_ranges: dict[str, tuple]) -> RowBatch:
     """
     Generation of data for Employees table.
 
@@ -38,42 +62,52 @@ def generate_employees(employees_id: List[int], job_salary_ranges: dict[str, tup
     Returns:
         Generated data for the Employees table.
     """
-    employees = {}
+    employees = RowBatch({
+        "employee_id": "int",
+        "first_name": "text",
+        "last_name": "text",
+        "email": "text",
+        "phone_number": "text",
+        "hire_date": "text",
+        "job_title": "category",
+        "salary": "float"
+    })
+    job_titles = list(job_salary_ranges.keys())
 
     for employee_id, _ in enumerate(employees_id, start=1):
-        job_title = choice(list(job_salary_ranges.keys()))
+        job_title = choice(job_titles)
         salary = round(uniform(*job_salary_ranges[job_title]), 2)
 
-        employees[employee_id] = {
-            "employee_id": employee_id,
-            "first_name": first_names[employee_id - 1],
-            "last_name": last_names[employee_id - 1],
-            "email": emails[employee_id - 1],
-            "phone_number": phone_numbers[employee_id - 1],
-            "hire_date": hire_dates[employee_id - 1],
-            "job_title": job_title,
-            "salary": salary
-        }
+        employees.append(
+            employee_id,
+            first_names[employee_id - 1],
+            last_names[employee_id - 1],
+            emails[employee_id - 1],
+            phone_numbers[employee_id - 1],
+            hire_dates[employee_id - 1],
+            job_title,
+            salary
+        )
 
     return employees
 
 # Projects table. PRIMARY_KEY = project_id.
-projects_id = list(range(1, 11))
+projects_id = list(range(1, projects_count + 1))
 
-projects_name = [fake.bs().title() for _ in range(10)]
+projects_name = [fake.bs().title() for _ in range(projects_count)]
 
 project_dates_budget = {}
 
 for project_name in projects_name:
-    start_date = fake.date_between(start_date=(datetime.today() - timedelta(days=548)), end_date='today')
-    end_date = fake.date_between(start_date=start_date, end_date=(datetime.today() + timedelta(days=150)))
+    start_date = fake.date_between(start_date=(today - timedelta(days=548)), end_date=today)
+    end_date = fake.date_between(start_date=start_date, end_date=(today + timedelta(days=150)))
     project_dates_budget[project_name] = {
         'start_date': start_date.strftime('%d.%m.%Y'),
         'end_date': end_date.strftime('%d.%m.%Y'),
         'budget': f"{round(uniform(5000, 10000), 2)}£"
     }
 
-def generate_projects(projects_id: List[int], projects_name: List[str]) -> dict[int, dict[str, Any]]:
+def generate_projects(projects_id: List[int], projects_name: List[str]) -> RowBatch:
     """
     Generation of data for Projects table.
 
@@ -84,24 +118,30 @@ def generate_projects(projects_id: List[int], projects_name: List[str]) -> dict[
     Returns:
         Generated data for the Projects table.
     """
-    projects = {}
+    projects = RowBatch({
+        "project_id": "int",
+        "project_name": "text",
+        "start_date": "text",
+        "end_date": "text",
+        "budget": "text"  # Stored with the currency sign, e.g. '7250.5£'.
+    })
 
     for project_id, _ in enumerate(projects_id, start=1):
         project_name = projects_name[project_id - 1]
-        projects[project_id] = {
-            "project_id": project_id,
-            "project_name": project_name,
-            "start_date": project_dates_budget[project_name]['start_date'],
-            "end_date": project_dates_budget[project_name]['end_date'],
-            "budget": project_dates_budget[project_name]['budget'],
-        }
+        projects.append(
+            project_id,
+            project_name,
+            project_dates_budget[project_name]['start_date'],
+            project_dates_budget[project_name]['end_date'],
+            project_dates_budget[project_name]['budget']
+        )
 
     return projects
 
 # Project_Assignments Table. PRIMARY_KEY = assignment_id.
 main_roles = [ 'Software Engineer','Project Manager', 'QA']
 
-def generate_project_assignments(employees_id: List[int], projects_id: List[int], main_roles: List[str], employees: dict[int, dict[str, Any]]) -> dict[int, dict[str, int]]:
+def generate_project_assignments(employees_id: List[int], projects_id: List[int], main_roles: List[str], employees: RowBatch) -> RowBatch:
     """
     Generation of data for Project_Assignments table.
 
@@ -133,7 +173,7 @@ def generate_project_assignments(employees_id: List[int], projects_id: List[int]
                 continue
 
             # If there are fewer than three people in the project and the role is not a primary one, we skip it.
-            if len(project_employees[project_id]) < 3 and employees[employee_id]['job_title'] not in main_roles:
+            if len(project_employees[project_id]) < 3 and employees.value('job_title', employee_id - 1) not in main_roles:
                 continue
 
             # Add connection.
@@ -159,25 +199,31 @@ def generate_project_assignments(employees_id: List[int], projects_id: List[int]
                 project_employees[project_id].add(possible_employee)
 
     # ProjectAssignments Table. PRIMARY_KEY = assignment_id. FOREIGN KEYs = employee_id (Employees), project_id (Projects)
-    project_assignments = {}
+    project_assignments = RowBatch({
+        "assignment_id": "int",
+        "employee_id": "int",
+        "project_id": "int",
+        "role": "category",
+        "hours_worked": "int"
+    })
 
     assignment_id = 1
 
     for employee_id, project_ids in employee_projects.items():
         for project_id in project_ids:
             hours = randint(10, 120)
-            project_assignments[assignment_id] = {
-                "assignment_id": assignment_id,
-                "employee_id": employee_id,
-                "project_id": project_id,
-                "role": employees[employee_id]['job_title'],
-                'hours_worked': hours
-            }
+            project_assignments.append(
+                assignment_id,
+                employee_id,
+                project_id,
+                employees.value('job_title', employee_id - 1),
+                hours
+            )
             assignment_id += 1
 
     return project_assignments
 
-def get_generated_data() -> Tuple[dict[int, dict[str, Any]], dict[int, dict[str, Any]], dict[int, dict[str, int]]]:
+def get_generated_data() -> Tuple[RowBatch, RowBatch, RowBatch]:
     """
     Generates full dataset for Employees, Projects, and Project Assignments.
 
@@ -194,24 +240,24 @@ def get_generated_data() -> Tuple[dict[int, dict[str, Any]], dict[int, dict[str,
 
 if __name__ == "__main__":
     employees, projects, project_assignments = get_generated_data()
-    print("employees:", employees)
-    print("projects:", projects)
-    print("project_assignments:", project_assignments)
+    print("employees:", list(employees))
+    print("projects:", list(projects))
+    print("project_assignments:", list(project_assignments))
 
 with sqlite3.connect("company.db") as conn:
     cursor = conn.cursor()
 
-def columns_names_list(table_data: dict[int, dict[str, Any]]) -> List[str]:
+def columns_names_list(table_data: RowBatch) -> List[str]:
     """
     Extract a list of column names from generated table data.
 
     Args:
-        table_data: A dictionary containing rows of a table, where keys are row IDs and values are dictionaries representing each row.
+        table_data: A batch containing the rows of a table.
 
     Returns:
-        A sorted list of column names for the table.
+        A list of column names for the table, in table order.
     """
-    return sorted(list(next(iter(table_data.values())).keys()))
+    return list(table_data.column_names)
 
 employees_columns_names = columns_names_list(employees)
 projects_columns_names = columns_names_list(projects)
@@ -249,12 +295,12 @@ employees_placeholders = placeholders(employees_columns_names)
 projects_placeholders = placeholders(projects_columns_names)
 project_assignments_placeholders = placeholders(project_assignments_columns_names)
 
-def insert_data(table_name: dict[int, dict[str, Any]], columns_names: List[str], columns_str: str, placeholders: str, table_sql_name: str) -> None:
+def insert_data(table_data: RowBatch, columns_names: List[str], columns_str: str, placeholders: str, table_sql_name: str) -> None:
     """
     Insert data into an SQLite table.
 
     Args:
-        table_data: A dictionary containing the table's data, where each value is a dictionary representing a row.
+        table_data: A batch containing the table's rows.
         columns_names: A list of column names.
         columns_str: A comma-separated string of column names for the SQL query.
         placeholders: A comma-separated string of SQL placeholders (e.g., '?, ?, ?').
@@ -264,12 +310,11 @@ def insert_data(table_name: dict[int, dict[str, Any]], columns_names: List[str],
         None.
     """
     try:
-        for row in table_name.values():
-            values_tuple = tuple(row[column] for column in columns_names)
-            cursor.execute(f'''
-                INSERT OR IGNORE INTO {table_sql_name} ({columns_str})
-                VALUES ({placeholders})
-            ''', values_tuple)
+        # Rows are streamed from the batch columns, no per-row dictionaries are built.
+        cursor.executemany(f'''
+            INSERT OR IGNORE INTO {table_sql_name} ({columns_str})
+            VALUES ({placeholders})
+        ''', table_data.rows(columns_names))
 
         conn.commit()
         print(f"Data successfully inserted into table '{table_sql_name}'.")
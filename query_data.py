@@ -255,8 +255,7 @@ def export(file_name: str, data: List[Tuple[Any, ...]], title: List[str], header
             writer = csv.writer(f, delimiter='|')
             writer.writerow(title)
             writer.writerow(header)
-            for row in data:
-                writer.writerow(row)
+            writer.writerows(data)
         print(f"Data exported to {file_name}")
     except Exception as e:
         print(f"Export failed: {e}")
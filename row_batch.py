@@ -0,0 +1,149 @@
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Storage for each column kind:
+#   "int"      - array of signed 64-bit integers.
+#   "float"    - array of doubles.
+#   "category" - array of small integer codes into a list of distinct values (job_title, role).
+#   "text"     - plain list of strings.
+column_kinds = ("int", "float", "category", "text")
+
+
+class RowBatch:
+    """
+    Column-oriented container for generated table rows.
+
+    Every column is stored separately, so a row costs a few bytes per numeric or categorical
+    value instead of a dictionary with repeated keys. Rows are read back as tuples, which can be
+    passed straight to cursor.executemany() or csv.writer.writerows().
+    """
+
+    def __init__(self, columns: Dict[str, str]) -> None:
+        """
+        Creates an empty batch.
+
+        Args:
+            columns: Column names in table order, mapped to their kind ("int", "float", "category" or "text").
+
+        Returns:
+            None.
+        """
+        self.column_names: List[str] = list(columns)
+        self._columns: Dict[str, Any] = {}
+        self._categories: Dict[str, List[Any]] = {}
+        self._category_codes: Dict[str, Dict[Any, int]] = {}
+
+        for name, kind in columns.items():
+            if kind not in column_kinds:
+                raise ValueError(f"Unknown column kind '{kind}' for column '{name}'.")
+
+            if kind == "int":
+                self._columns[name] = array("q")
+            elif kind == "float":
+                self._columns[name] = array("d")
+            elif kind == "category":
+                self._columns[name] = array("B")
+                self._categories[name] = []
+                self._category_codes[name] = {}
+            else:
+                self._columns[name] = []
+
+    def __len__(self) -> int:
+        return len(self._columns[self.column_names[0]]) if self.column_names else 0
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return self.rows()
+
+    def __repr__(self) -> str:
+        return f"RowBatch(columns={self.column_names}, rows={len(self)})"
+
+    def append(self, *values: Any) -> None:
+        """
+        Adds one row.
+
+        Args:
+            values: Row values in the same order as column_names.
+
+        Returns:
+            None.
+        """
+        if len(values) != len(self.column_names):
+            raise ValueError(f"Expected {len(self.column_names)} values, got {len(values)}.")
+
+        appended = []
+        try:
+            for name, value in zip(self.column_names, values):
+                if name in self._category_codes:
+                    value = self._encode(name, value)
+                self._columns[name].append(value)
+                appended.append(name)
+        except Exception:
+            # A value of the wrong type: undo the columns already filled, so they keep the same length.
+            for name in appended:
+                self._columns[name].pop()
+            raise
+
+    def _encode(self, name: str, value: Any) -> int:
+        """
+        Returns the code of a categorical value, registering it if it is new.
+
+        Args:
+            name: Categorical column name.
+            value: Value to encode.
+
+        Returns:
+            Integer code of the value.
+        """
+        codes = self._category_codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = len(self._categories[name])
+            codes[value] = code
+            self._categories[name].append(value)
+            # One byte per code is enough for up to 256 distinct values; widen only when needed.
+            if code == 256:
+                self._columns[name] = array("L", self._columns[name])
+        return code
+
+    def column(self, name: str) -> Iterator[Any]:
+        """
+        Iterates over the values of one column.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            Iterator over the column values.
+        """
+        if name in self._categories:
+            categories = self._categories[name]
+            return (categories[code] for code in self._columns[name])
+        return iter(self._columns[name])
+
+    def value(self, name: str, index: int) -> Any:
+        """
+        Returns a single value.
+
+        Args:
+            name: Column name.
+            index: Row position in the batch (0-based).
+
+        Returns:
+            The stored value.
+        """
+        stored = self._columns[name][index]
+        if name in self._categories:
+            return self._categories[name][stored]
+        return stored
+
+    def rows(self, columns: Optional[List[str]] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterates over rows as tuples, without building an intermediate row object.
+
+        Args:
+            columns: Columns to include and their order. Defaults to column_names.
+
+        Returns:
+            Iterator over row tuples.
+        """
+        return zip(*(self.column(name) for name in (self.column_names if columns is None else columns)))
@@ -0,0 +1,256 @@
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+from faker import VERSION as faker_version
+
+# Scripts that define the schema and the generator. Their contents are part of the cache key,
+# together with the Faker and Python versions, so changing any of them invalidates every stored template.
+project_dir = Path(__file__).resolve().parent
+schema_script = project_dir / "create_db.py"
+generator_script = project_dir / "generate_data.py"
+generator_sources = [generator_script, project_dir / "row_batch.py"]
+
+default_cache_dir = Path(os.environ.get("SFP_CACHE_DIR", Path.home() / ".cache" / "sqlite-faker-project"))
+default_max_size = 1024 * 1024 * 1024  # 1 GiB of templates in total.
+default_max_age = 7 * 24 * 60 * 60  # One week, in seconds.
+
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write file clones (btrfs, xfs).
+
+
+def file_hash(*paths: Path) -> str:
+    """
+    Computes a short SHA-256 hash of the contents of one or more files.
+
+    Args:
+        paths: Files to hash.
+
+    Returns:
+        First 16 hex characters of the digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def template_name(seed: int, scale: int, locale: str) -> str:
+    """
+    Builds the cache file name for a template database.
+
+    Args:
+        seed: Seed passed to Faker and random.
+        scale: Row count multiplier.
+        locale: Faker locale.
+
+    Returns:
+        File name made of the schema hash, generator version, Faker and Python versions, seed, scale and locale.
+    """
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return (f"{file_hash(schema_script)}-{file_hash(*generator_sources)}-f{faker_version}-py{python_version}"
+            f"-s{seed}-x{scale}-{locale}.db")
+
+
+def build_template(target: Path, seed: int, scale: int, locale: str) -> None:
+    """
+    Creates, fills and compacts a fresh database by running create_db.py and generate_data.py.
+
+    Args:
+        target: Path where the finished database is written.
+        seed: Seed passed to Faker and random.
+        scale: Row count multiplier.
+        locale: Faker locale.
+
+    Returns:
+        None.
+    """
+    env = dict(os.environ, SFP_SEED=str(seed), SFP_SCALE=str(scale), SFP_LOCALE=locale)
+
+    with tempfile.TemporaryDirectory(dir=target.parent) as work_dir:
+        # Both scripts write to "company.db" in the current directory.
+        for script in (schema_script, generator_script):
+            subprocess.run([sys.executable, str(script)], cwd=work_dir, env=env, check=True, stdout=subprocess.DEVNULL)
+
+        db_path = Path(work_dir) / "company.db"
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("ANALYZE;")  # Index statistics for the query planner.
+            conn.commit()
+            conn.execute("VACUUM;")  # Defragment so copies are as small as possible.
+        finally:
+            conn.close()
+
+        os.replace(db_path, target)
+
+
+def copy_database(source: BinaryIO, target: Path) -> None:
+    """
+    Copies a database file, using a copy-on-write clone when the file system supports it.
+
+    The copy is written to a unique temporary file next to the target and renamed into place,
+    so a half-written company.db is never left behind, even with several processes running.
+
+    Args:
+        source: Template database opened in binary mode.
+        target: Database file to create or replace.
+
+    Returns:
+        None.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name)
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, "wb") as dst:
+            try:
+                import fcntl
+                fcntl.ioctl(dst.fileno(), FICLONE, source.fileno())
+            except (ImportError, OSError):
+                source.seek(0)
+                shutil.copyfileobj(source, dst, 1024 * 1024)
+        # mkstemp creates the file readable by the owner only; keep the template's permissions instead.
+        os.chmod(tmp_path, os.fstat(source.fileno()).st_mode & 0o777)
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def remove_template(path: Path) -> bool:
+    """
+    Deletes a template, tolerating other processes that use or remove it at the same time.
+
+    Args:
+        path: Template to delete.
+
+    Returns:
+        True if the file is gone, False if it is still in use (Windows does not delete open files).
+    """
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass  # Already removed by another process.
+    except OSError:
+        return False
+    return True
+
+
+def evict(cache_dir: Path, max_size: int, max_age: float, keep: Optional[Path] = None) -> List[Path]:
+    """
+    Removes expired templates, then the least recently used ones until the cache fits in max_size.
+
+    Args:
+        cache_dir: Directory with the cached templates.
+        max_size: Maximum total size of all templates, in bytes.
+        max_age: Maximum time since a template was last used, in seconds.
+        keep: Template that must not be removed (the one just used).
+
+    Returns:
+        List of removed files.
+    """
+    removed = []
+    now = time.time()
+
+    templates = []
+    for path in cache_dir.glob("*.db"):
+        try:
+            templates.append((path, path.stat()))
+        except FileNotFoundError:
+            continue  # Removed by another process.
+
+    # Oldest first; the modification time is refreshed on every cache hit.
+    templates.sort(key=lambda item: item[1].st_mtime)
+
+    remaining = []
+    for path, stat in templates:
+        if path != keep and now - stat.st_mtime > max_age and remove_template(path):
+            removed.append(path)
+        else:
+            remaining.append((path, stat))
+
+    total_size = sum(stat.st_size for _, stat in remaining)
+    for path, stat in remaining:
+        if total_size <= max_size:
+            break
+        if path == keep or not remove_template(path):
+            continue
+        total_size -= stat.st_size
+        removed.append(path)
+
+    return removed
+
+
+def materialise(target: Path, seed: int, scale: int = 1, locale: str = "en_GB",
+                cache_dir: Path = default_cache_dir, max_size: int = default_max_size,
+                max_age: float = default_max_age) -> bool:
+    """
+    Creates a seeded database at target, reusing a cached template when one exists.
+
+    Args:
+        target: Database file to create or replace (usually company.db).
+        seed: Seed passed to Faker and random.
+        scale: Row count multiplier.
+        locale: Faker locale.
+        cache_dir: Directory with the cached templates.
+        max_size: Maximum total size of all templates, in bytes.
+        max_age: Maximum time since a template was last used, in seconds.
+
+    Returns:
+        True on a cache hit, False if the template had to be generated.
+    """
+    if scale < 1:
+        raise ValueError("Scale must be at least 1.")
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    template = cache_dir / template_name(seed, scale, locale)
+
+    # The template is opened before copying: another process may evict it at any moment,
+    # but an open file stays readable until it is closed.
+    try:
+        source = open(template, "rb")
+        hit = True
+    except FileNotFoundError:
+        build_template(template, seed, scale, locale)
+        source = open(template, "rb")
+        hit = False
+
+    with source:
+        if hit:
+            try:
+                os.utime(template)  # Mark as recently used.
+            except FileNotFoundError:
+                pass
+        copy_database(source, target)
+
+    evict(cache_dir, max_size, max_age, keep=template)
+    return hit
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create company.db from a cached, seeded template.")
+    parser.add_argument("--seed", type=int, required=True, help="Seed for Faker and random.")
+    parser.add_argument("--scale", type=int, default=1, help="Row count multiplier (1 = 50 employees, 10 projects).")
+    parser.add_argument("--locale", default="en_GB", help="Faker locale.")
+    parser.add_argument("--output", default="company.db", help="Database file to create.")
+    parser.add_argument("--cache-dir", default=str(default_cache_dir), help="Directory for cached templates.")
+    parser.add_argument("--max-size-mb", type=int, default=default_max_size // (1024 * 1024),
+                        help="Maximum total size of the cache, in MB.")
+    parser.add_argument("--max-age-days", type=float, default=default_max_age / (24 * 60 * 60),
+                        help="Remove templates not used for this many days.")
+    args = parser.parse_args()
+
+    if args.scale < 1:
+        parser.error("--scale must be at least 1.")
+
+    cache_hit = materialise(Path(args.output), args.seed, args.scale, args.locale,
+                            cache_dir=Path(args.cache_dir),
+                            max_size=args.max_size_mb * 1024 * 1024,
+                            max_age=args.max_age_days * 24 * 60 * 60)
+    print(f"{'Copied cached template' if cache_hit else 'Generated new template'} to {args.output}")